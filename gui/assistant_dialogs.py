@@ -5,23 +5,64 @@
 # For more details on PySide6's license, see <https://www.qt.io/licensing>
 
 from PySide6 import QtGui
-from PySide6.QtWidgets import QDialog, QGroupBox, QSplitter, QComboBox, QSpinBox, QListWidgetItem, QTabWidget, QSizePolicy, QHBoxLayout, QWidget, QFileDialog, QListWidget, QLineEdit, QVBoxLayout, QPushButton, QLabel, QCheckBox, QTextEdit, QMessageBox, QSlider
-from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QIcon, QTextOption
+from PySide6.QtWidgets import QDialog, QGroupBox, QSplitter, QComboBox, QSpinBox, QListWidgetItem, QTabWidget, QSizePolicy, QHBoxLayout, QWidget, QFileDialog, QListWidget, QListView, QLineEdit, QVBoxLayout, QPushButton, QLabel, QCheckBox, QTextEdit, QMessageBox, QSlider
+from PySide6.QtCore import Qt, QSize, Signal, Slot, QRunnable, QThreadPool, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QIcon, QTextOption, QTextCursor
 
 import json, os, shutil, threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from azure.ai.assistant.management.assistant_config_manager import AssistantConfigManager
 from azure.ai.assistant.management.assistant_config import ToolResourcesConfig, VectorStoreConfig
 from azure.ai.assistant.management.function_config_manager import FunctionConfigManager
 from azure.ai.assistant.management.ai_client_factory import AIClientType, AIClientFactory
 from azure.ai.assistant.management.logger_module import logger
-from gui.signals import UserInputSendSignal, UserInputSignal
+from gui.signals import UserInputSendSignal, UserInputSignal, ModelsLoadedSignal
 from gui.speech_input_handler import SpeechInputHandler
 from gui.signals import ErrorSignal, StartStatusAnimationSignal, StopStatusAnimationSignal
 from gui.status_bar import ActivityStatus, StatusBar
 from gui.utils import resource_path
 
+# AI client type names and their combo box indexes, the enum does not change at runtime
+_AI_CLIENT_NAMES = tuple(client_type.name for client_type in AIClientType)
+_AI_CLIENT_INDEX = {name: index for index, name in enumerate(_AI_CLIENT_NAMES)}
+
+# Microphone icons shared by all dialog instances, loaded on first use since QIcon needs a QApplication
+_MIC_ON_ICON = None
+_MIC_OFF_ICON = None
+
+
+def _mic_icons():
+    global _MIC_ON_ICON, _MIC_OFF_ICON
+    if _MIC_ON_ICON is None:
+        _MIC_ON_ICON = QIcon(resource_path("gui/images/mic_on.png"))
+        _MIC_OFF_ICON = QIcon(resource_path("gui/images/mic_off.png"))
+    return _MIC_ON_ICON, _MIC_OFF_ICON
+
+
+# Shared style sheet for the dialog, parsed once instead of per widget
+_DIALOG_QSS = (
+    "QLineEdit#nameEdit, QTextEdit#instructionsEdit, QComboBox#modelComboBox QLineEdit {"
+    "  border-style: solid;"
+    "  border-width: 1px;"
+    "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
+    "  padding: 1px;"
+    "}"
+    "QListWidget#fileReferenceList, QListView#codeFileList, QListView#fileSearchList {"
+    "  border-style: solid;"
+    "  border-width: 1px;"
+    "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
+    "}"
+)
+
+
+@lru_cache(maxsize=None)
+def _read_template(template_path):
+    # Export templates do not change while the application is running
+    with open(template_path, "r") as template_file:
+        return template_file.read()
+
 
 class CustomSpinBox(QSpinBox):
     def __init__(self, parent=None):
@@ -34,6 +75,84 @@ class CustomSpinBox(QSpinBox):
         return str(value)
 
 
+class FileListModel(QAbstractListModel):
+    """
+    List model of file paths and their file ids, the id is exposed with Qt.UserRole
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._ids = []
+        self._rows = {}  # file path -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._paths[index.row()]
+        if role == Qt.UserRole:
+            return self._ids[index.row()]
+        return None
+
+    def __contains__(self, file_path):
+        return file_path in self._rows
+
+    def add_file(self, file_path, file_id=None):
+        self.add_files({file_path: file_id})
+
+    def add_files(self, files):
+        # Append all new files with a single row insertion
+        new_files = [(file_path, file_id) for file_path, file_id in files.items() if file_path not in self._rows]
+        if not new_files:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_files) - 1)
+        for file_path, file_id in new_files:
+            self._rows[file_path] = len(self._paths)
+            self._paths.append(file_path)
+            self._ids.append(file_id)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        # Remove contiguous ranges starting from the end so that the remaining row numbers stay valid
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._paths[first:last + 1]
+            del self._ids[first:last + 1]
+            self.endRemoveRows()
+        self._rows = {file_path: row for row, file_path in enumerate(self._paths)}
+
+    def clear(self):
+        self.beginResetModel()
+        self._paths = []
+        self._ids = []
+        self._rows = {}
+        self.endResetModel()
+
+    def files(self):
+        return dict(zip(self._paths, self._ids))
+
+
+class InstructionsReviewRunnable(QRunnable):
+    def __init__(self, dialog, instructions):
+        super().__init__()
+        self.dialog = dialog
+        self.instructions = instructions
+
+    def run(self):
+        self.dialog._check_instructions(self.instructions)
+
+
 class AssistantConfigDialog(QDialog):
     assistantConfigSubmitted = Signal(str, str, str)
 
@@ -58,22 +177,22 @@ class AssistantConfigDialog(QDialog):
         self.init_ui()
 
     def init_variables(self):
-        self.code_interpreter_files = {}
-        self.file_search_files = {}
+        self.code_interpreter_file_model = FileListModel(self)
+        self.file_search_file_model = FileListModel(self)
         self.vector_store_ids = []
-        self.functions = []  # Store the functions
-        self.code_interpreter = False  # Store the code interpreter setting
-        self.file_search = False  # Store the file search setting
-        self.checkBoxes = {}  # To keep track of all function checkboxes
+        self.functions = {}  # Store the selected function specs by function name
         self.assistant_id = ''
+        self._instructions_synced = False  # Cleared when the Configuration tab instructions change
+        self._new_instructions_synced = True  # Cleared when the Instructions Editor text changes
+        self._review_busy = False  # Set while an instructions review is running
+        self._model_cache = {}  # Model ids fetched per AI client type during the dialog lifetime
+        self._model_fetches = set()  # AI client types with a model fetch in flight
         self.default_output_folder_path = os.path.join(os.getcwd(), 'output')
-        # make sure the output folder path exists and create it if it doesn't
-        if not os.path.exists(self.default_output_folder_path):
-            os.makedirs(self.default_output_folder_path)
 
     def init_speech_input(self):
         self.is_mic_on = False
         self.currentHypothesis = ""
+        self._hypothesis_cursor = None  # Cursor selecting the current hypothesis in the Instructions Editor
         self.user_input_signal = UserInputSignal()
         self.user_input_send_signal = UserInputSendSignal()
         self.user_input_signal.update_signal.connect(self.on_user_input)
@@ -84,16 +203,28 @@ class AssistantConfigDialog(QDialog):
             logger.error(f"Error initializing speech input handler: {e}")
 
     def on_tab_changed(self, index):
+        # Build the lazily constructed tab on first activation
+        self._ensure_tab(index)
+
         # Check if the microphone is on when changing tabs
         if self.is_mic_on:
             self.toggle_mic()
 
         # If the Instructions Editor tab is selected, copy the instructions from the Configuration tab
-        if index == 3:
+        # unless they have not changed since the editors were last synchronized
+        if index == 3 and not self._instructions_synced:
             self.newInstructionsEdit.setPlainText(self.instructionsEdit.toPlainText())
+            self._instructions_synced = self._new_instructions_synced = True
         # If the Configuration tab is selected, copy the instructions from the Instructions Editor tab
-        elif index == 0 and hasattr(self, 'newInstructionsEdit') and self.newInstructionsEdit.toPlainText() != "":
-            self.instructionsEdit.setPlainText(self.newInstructionsEdit.toPlainText())
+        elif index == 0 and hasattr(self, 'newInstructionsEdit') and not self._new_instructions_synced:
+            new_instructions = self.newInstructionsEdit.toPlainText()
+            if new_instructions != "":
+                self.instructionsEdit.setPlainText(new_instructions)
+                self._instructions_synced = True
+            else:
+                # An empty editor is not copied, so copy the General tab text again on the next visit
+                self._instructions_synced = False
+            self._new_instructions_synced = True
 
     def closeEvent(self, event):
         # Check if the microphone is on when closing the window
@@ -103,23 +234,25 @@ class AssistantConfigDialog(QDialog):
 
     def init_ui(self):
         self.setWindowTitle("Assistant Configuration")
+        self.setStyleSheet(_DIALOG_QSS)
         self.tabWidget = QTabWidget(self)
+        # Tools and Instructions Editor tabs are built when first needed, see _ensure_tab
+        self._tab_builders = {1: self.create_tools_tab, 3: self.create_instructions_tab}
+        self._tab_built = [True, False, True, False]
         self.tabWidget.currentChanged.connect(self.on_tab_changed)
 
         # Create General Configuration tab
         configTab = self.create_config_tab()
         self.tabWidget.addTab(configTab, "General")
 
-        # Create Tools tab
-        toolsTab = self.create_tools_tab()
-        self.tabWidget.addTab(toolsTab, "Tools")
+        # Create placeholder for Tools tab
+        self.tabWidget.addTab(self.create_placeholder_tab(), "Tools")
 
         completionTab = self.create_completion_tab()
         self.tabWidget.addTab(completionTab, "Completion")
 
-        # Create Instructions Editor tab
-        instructionsEditorTab = self.create_instructions_tab()
-        self.tabWidget.addTab(instructionsEditorTab, "Instructions Editor")
+        # Create placeholder for Instructions Editor tab
+        self.tabWidget.addTab(self.create_placeholder_tab(), "Instructions Editor")
 
         # Set the main layout
         mainLayout = QVBoxLayout(self)
@@ -143,6 +276,8 @@ class AssistantConfigDialog(QDialog):
         self.start_processing_signal.start_signal.connect(self.start_processing)
         self.stop_processing_signal.stop_signal.connect(self.stop_processing)
         self.error_signal.error_signal.connect(lambda error_message: QMessageBox.warning(self, "Error", error_message))
+        self.models_loaded_signal = ModelsLoadedSignal()
+        self.models_loaded_signal.loaded_signal.connect(self.on_models_loaded)
 
         self.update_model_combobox()
         self.update_assistant_combobox()
@@ -150,6 +285,20 @@ class AssistantConfigDialog(QDialog):
         # Set the initial size of the dialog to make it wider
         self.resize(600, 600)
 
+    def create_placeholder_tab(self):
+        placeholderTab = QWidget()
+        placeholderLayout = QVBoxLayout(placeholderTab)
+        placeholderLayout.setContentsMargins(0, 0, 0, 0)
+        return placeholderTab
+
+    def _ensure_tab(self, index):
+        # Build the real tab content into its placeholder page if not done yet
+        if index not in self._tab_builders or self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        tab = self._tab_builders[index]()
+        self.tabWidget.widget(index).layout().addWidget(tab)
+
     def create_config_tab(self):
         configTab = QWidget()  # Configuration tab
         configLayout = QVBoxLayout(configTab)
@@ -157,10 +306,9 @@ class AssistantConfigDialog(QDialog):
         # AI client selection
         self.aiClientLabel = QLabel('AI Client:')
         self.aiClientComboBox = QComboBox()
-        ai_client_type_names = [client_type.name for client_type in AIClientType]
-        self.aiClientComboBox.addItems(ai_client_type_names)
+        self.aiClientComboBox.addItems(_AI_CLIENT_NAMES)
         active_ai_client_type = self.main_window.active_ai_client_type
-        self.aiClientComboBox.setCurrentIndex(ai_client_type_names.index(active_ai_client_type.name))
+        self.aiClientComboBox.setCurrentIndex(_AI_CLIENT_INDEX[active_ai_client_type.name])
         self.aiClientComboBox.currentIndexChanged.connect(self.ai_client_selection_changed)
         configLayout.addWidget(self.aiClientLabel)
         configLayout.addWidget(self.aiClientComboBox)
@@ -175,31 +323,18 @@ class AssistantConfigDialog(QDialog):
         # Name input field
         self.nameLabel = QLabel('Name:')
         self.nameEdit = QLineEdit()
-        self.nameEdit.setStyleSheet(
-            "QLineEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "  padding: 1px;"
-            "}"
-        )
+        self.nameEdit.setObjectName("nameEdit")
         configLayout.addWidget(self.nameLabel)
         configLayout.addWidget(self.nameEdit)
 
         # Instructions - using QTextEdit for multi-line input
         self.instructionsLabel = QLabel('Instructions:')
         self.instructionsEdit = QTextEdit()
-        self.instructionsEdit.setStyleSheet(
-            "QTextEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "  padding: 1px;"
-            "}"
-        )
+        self.instructionsEdit.setObjectName("instructionsEdit")
         self.instructionsEdit.setAcceptRichText(False)
         self.instructionsEdit.setWordWrapMode(QTextOption.WordWrap)
         self.instructionsEdit.setMinimumHeight(100)
+        self.instructionsEdit.textChanged.connect(lambda: setattr(self, '_instructions_synced', False))
         configLayout.addWidget(self.instructionsLabel)
         configLayout.addWidget(self.instructionsEdit)
 
@@ -208,13 +343,7 @@ class AssistantConfigDialog(QDialog):
         self.fileReferenceList = QListWidget()
         self.fileReferenceList.setMaximumHeight(100)
         self.fileReferenceList.setToolTip("Select files to be used as references in the assistant instructions, example: {file_reference:0}, where 0 is the index of the file in the list")
-        self.fileReferenceList.setStyleSheet(
-            "QListWidget {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "}"
-        )
+        self.fileReferenceList.setObjectName("fileReferenceList")
         self.fileReferenceAddButton = QPushButton('Add File...')
         self.fileReferenceAddButton.clicked.connect(self.add_reference_file)
         self.fileReferenceRemoveButton = QPushButton('Remove File')
@@ -232,14 +361,7 @@ class AssistantConfigDialog(QDialog):
         self.modelLabel = QLabel('Model:')
         self.modelComboBox = QComboBox()
         self.modelComboBox.setEditable(True)
-        self.modelComboBox.setStyleSheet(
-            "QLineEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "  padding: 1px;"
-            "}"
-        )
+        self.modelComboBox.setObjectName("modelComboBox")
         configLayout.addWidget(self.modelLabel)
         configLayout.addWidget(self.modelComboBox)
 
@@ -286,15 +408,19 @@ class AssistantConfigDialog(QDialog):
         userFunctionsLayout.addWidget(self.userFunctionsList)
         splitter.addWidget(userFunctionsGroup)
 
-        self.systemFunctionsList.itemChanged.connect(self.handle_function_selection)
-        self.userFunctionsList.itemChanged.connect(self.handle_function_selection)
-
-        # Function sections
+        # Function sections, populated with repaints suppressed and before itemChanged is connected
         if self.function_config_manager:
             function_configs = self.function_config_manager.get_function_configs()
+            self.systemFunctionsList.setUpdatesEnabled(False)
+            self.userFunctionsList.setUpdatesEnabled(False)
             for function_type, funcs in function_configs.items():
                 list_widget = self.systemFunctionsList if function_type == 'system' else self.userFunctionsList
                 self.create_function_section(list_widget, function_type, funcs)
+            self.systemFunctionsList.setUpdatesEnabled(True)
+            self.userFunctionsList.setUpdatesEnabled(True)
+
+        self.systemFunctionsList.itemChanged.connect(self.handle_function_selection)
+        self.userFunctionsList.itemChanged.connect(self.handle_function_selection)
 
         if self.assistant_type == "assistant":
             # Section for managing code interpreter files
@@ -302,7 +428,6 @@ class AssistantConfigDialog(QDialog):
 
             # Checkbox to enable code interpreter tool
             self.codeInterpreterCheckBox = QCheckBox("Enable Code Interpreter")
-            self.codeInterpreterCheckBox.stateChanged.connect(lambda state: setattr(self, 'code_interpreter', state == Qt.CheckState.Checked.value))
             toolsLayout.addWidget(self.codeInterpreterCheckBox)
 
             # Section for managing files for file search vector stores
@@ -310,25 +435,19 @@ class AssistantConfigDialog(QDialog):
 
             # Checkbox to enable file search tool
             self.fileSearchCheckBox = QCheckBox("Enable File Search")
-            self.fileSearchCheckBox.stateChanged.connect(lambda state: setattr(self, 'file_search', state == Qt.CheckState.Checked.value))
             toolsLayout.addWidget(self.fileSearchCheckBox)
 
         return toolsTab
 
     def setup_code_interpreter_files(self, layout):
         codeFilesLabel = QLabel('Files for Code Interpreter:')
-        self.codeFileList = QListWidget()
-        self.codeFileList.setStyleSheet(
-            "QListWidget {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "}"
-        )
+        self.codeFileList = QListView()
+        self.codeFileList.setObjectName("codeFileList")
+        self.codeFileList.setModel(self.code_interpreter_file_model)
         addCodeFileButton = QPushButton('Add File...')
-        addCodeFileButton.clicked.connect(lambda: self.add_file(self.code_interpreter_files, self.codeFileList))
+        addCodeFileButton.clicked.connect(lambda: self.add_file(self.code_interpreter_file_model))
         removeCodeFileButton = QPushButton('Remove File')
-        removeCodeFileButton.clicked.connect(lambda: self.remove_file(self.code_interpreter_files, self.codeFileList))
+        removeCodeFileButton.clicked.connect(lambda: self.remove_file(self.code_interpreter_file_model, self.codeFileList))
 
         codeFileButtonLayout = QHBoxLayout()
         codeFileButtonLayout.addWidget(addCodeFileButton)
@@ -340,18 +459,13 @@ class AssistantConfigDialog(QDialog):
 
     def setup_file_search_vector_stores(self, layout):
         fileSearchLabel = QLabel('Files for File Search Vector Store:')
-        self.fileSearchList = QListWidget()
-        self.fileSearchList.setStyleSheet(
-            "QListWidget {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
-            "}"
-        )
+        self.fileSearchList = QListView()
+        self.fileSearchList.setObjectName("fileSearchList")
+        self.fileSearchList.setModel(self.file_search_file_model)
         addFileSearchFileButton = QPushButton('Add File...')
-        addFileSearchFileButton.clicked.connect(lambda: self.add_file(self.file_search_files, self.fileSearchList))
+        addFileSearchFileButton.clicked.connect(lambda: self.add_file(self.file_search_file_model))
         removeFileSearchFileButton = QPushButton('Remove File')
-        removeFileSearchFileButton.clicked.connect(lambda: self.remove_file(self.file_search_files, self.fileSearchList))
+        removeFileSearchFileButton.clicked.connect(lambda: self.remove_file(self.file_search_file_model, self.fileSearchList))
 
         fileSearchFileButtonLayout = QHBoxLayout()
         fileSearchFileButtonLayout.addWidget(addFileSearchFileButton)
@@ -537,15 +651,20 @@ class AssistantConfigDialog(QDialog):
 
     def update_assistant_combobox(self):
         self.ai_client_type = AIClientType[self.aiClientComboBox.currentText()]
-        assistant_config_manager = AssistantConfigManager.get_instance()
-        assistant_names = assistant_config_manager.get_assistant_names_by_client_type(self.ai_client_type.name)
-
+        # Filter by assistant type in one pass over the manager's in-memory configs
+        assistant_configs = self.assistant_config_manager.configs
+        assistant_names = [
+            assistant_name for assistant_name in self.assistant_config_manager.get_assistant_names_by_client_type(self.ai_client_type.name)
+            if assistant_configs[assistant_name].assistant_type == self.assistant_type
+        ]
+
+        # Populate without triggering assistant_selection_changed, the selection below fires it once
+        self.assistantComboBox.blockSignals(True)
         self.assistantComboBox.clear()
-        self.assistantComboBox.insertItem(0, "New Assistant")
-        for assistant_name in assistant_names:
-            assistant_config = assistant_config_manager.get_config(assistant_name)
-            if assistant_config.assistant_type == self.assistant_type:
-                self.assistantComboBox.addItem(assistant_name)
+        self.assistantComboBox.addItem("New Assistant")
+        self.assistantComboBox.addItems(assistant_names)
+        self.assistantComboBox.setCurrentIndex(-1)
+        self.assistantComboBox.blockSignals(False)
         self.set_initial_assistant_selection()
 
     def set_initial_assistant_selection(self):
@@ -558,20 +677,52 @@ class AssistantConfigDialog(QDialog):
     def update_model_combobox(self):
         self.ai_client_type = AIClientType[self.aiClientComboBox.currentText()]
         self.modelComboBox.clear()
+        if self.ai_client_type in self._model_cache:
+            self.set_model_items(self._model_cache[self.ai_client_type])
+        elif self.ai_client_type == AIClientType.OPEN_AI and self.ai_client_type not in self._model_fetches:
+            # Fetch the models in the background to keep the dialog responsive
+            self._model_fetches.add(self.ai_client_type)
+            self.status_bar.start_animation(ActivityStatus.LOADING_MODELS)
+            threading.Thread(target=self._fetch_models, args=(self.ai_client_type,), daemon=True).start()
+
+        if self.ai_client_type == AIClientType.OPEN_AI:
+            self.modelComboBox.setToolTip("Select a model ID supported for assistant from the list")
+        elif self.ai_client_type == AIClientType.AZURE_OPEN_AI:
+            self.modelComboBox.setToolTip("Select a model deployment name from the Azure OpenAI resource")
+
+    def _fetch_models(self, ai_client_type):
+        model_ids = []
         try:
-            ai_client = AIClientFactory.get_instance().get_client(self.ai_client_type)
-            if self.ai_client_type == AIClientType.OPEN_AI:
-                if ai_client:
-                    models = ai_client.models.list().data
-                    for model in models:
-                        self.modelComboBox.addItem(model.id)
+            ai_client = AIClientFactory.get_instance().get_client(ai_client_type)
+            if ai_client:
+                model_ids = [model.id for model in ai_client.models.list().data]
         except Exception as e:
             logger.error(f"Error getting models from AI client: {e}")
         finally:
-            if self.ai_client_type == AIClientType.OPEN_AI:
-                self.modelComboBox.setToolTip("Select a model ID supported for assistant from the list")
-            elif self.ai_client_type == AIClientType.AZURE_OPEN_AI:
-                self.modelComboBox.setToolTip("Select a model deployment name from the Azure OpenAI resource")
+            self.models_loaded_signal.loaded_signal.emit(ai_client_type.name, model_ids)
+
+    def on_models_loaded(self, ai_client_type_name, model_ids):
+        ai_client_type = AIClientType[ai_client_type_name]
+        self._model_fetches.discard(ai_client_type)
+        if not self._model_fetches:
+            self.status_bar.stop_animation(ActivityStatus.LOADING_MODELS)
+        if model_ids:
+            self._model_cache[ai_client_type] = model_ids
+        # Ignore results for a client type that is no longer selected
+        if ai_client_type == self.ai_client_type:
+            self.set_model_items(model_ids)
+
+    def set_model_items(self, model_ids):
+        # Keep the current model (e.g. pre-loaded from the assistant config) selected after repopulating
+        current_model = self.modelComboBox.currentText()
+        self.modelComboBox.clear()
+        self.modelComboBox.addItems(model_ids)
+        if current_model:
+            index = self.modelComboBox.findText(current_model)
+            if index < 0:
+                self.modelComboBox.addItem(current_model)
+                index = self.modelComboBox.count() - 1
+            self.modelComboBox.setCurrentIndex(index)
 
     def assistant_selection_changed(self):
         selected_assistant = self.assistantComboBox.currentText()
@@ -593,36 +744,33 @@ class AssistantConfigDialog(QDialog):
         return self.nameEdit.text()
 
     def reset_fields(self):
+        self._ensure_tab(1)
         self.nameEdit.clear()
         self.instructionsEdit.clear()
         self.modelComboBox.setCurrentIndex(0)
         self.vector_store_ids = []
-        self.file_search_files = {}
-        self.code_interpreter_files = {}
-        # Reset all checkboxes in the function sections
-        for function_type, checkBoxes in self.checkBoxes.items():
-            for checkBox in checkBoxes:
-                checkBox.setChecked(False)
-        self.functions = []
-        self.file_search = False
-        self.code_interpreter = False
+        self.file_search_file_model.clear()
+        self.code_interpreter_file_model.clear()
+        # Uncheck all functions without dispatching handle_function_selection per item,
+        # the selection is cleared once afterwards
+        for listWidget in [self.systemFunctionsList, self.userFunctionsList]:
+            listWidget.blockSignals(True)
+            for i in range(listWidget.count()):
+                listWidget.item(i).setCheckState(Qt.Unchecked)
+            listWidget.blockSignals(False)
+        self.functions.clear()
         if self.assistant_type == "assistant":
             self.fileSearchCheckBox.setChecked(False)
             self.codeInterpreterCheckBox.setChecked(False)
         self.outputFolderPathEdit.clear()
         self.assistant_config = None
-        if hasattr(self, 'fileSearchList'):            
-            self.fileSearchList.clear()
-        if hasattr(self, 'codeFileList'):
-            self.codeFileList.clear()
 
     def create_instructions_tab(self):
         instructionsEditorTab = QWidget()
         instructionsEditorLayout = QVBoxLayout(instructionsEditorTab)
 
         # Load icons
-        self.mic_on_icon = QIcon(resource_path("gui/images/mic_on.png"))
-        self.mic_off_icon = QIcon(resource_path("gui/images/mic_off.png"))
+        self.mic_on_icon, self.mic_off_icon = _mic_icons()
 
         # Microphone button
         self.micButton = QPushButton()
@@ -642,6 +790,7 @@ class AssistantConfigDialog(QDialog):
         # QTextEdit for entering instructions
         self.newInstructionsEdit = QTextEdit()
         self.newInstructionsEdit.setText("")
+        self.newInstructionsEdit.textChanged.connect(lambda: setattr(self, '_new_instructions_synced', False))
         instructionsEditorLayout.addWidget(self.newInstructionsEdit)
 
         # 'Check Instructions' button
@@ -651,6 +800,16 @@ class AssistantConfigDialog(QDialog):
 
         return instructionsEditorTab
 
+    def _ensure_output_folder(self):
+        # Create the output folder only when a configuration is actually saved
+        output_folder_path = self.outputFolderPathEdit.text() or self.default_output_folder_path
+        try:
+            os.makedirs(output_folder_path, exist_ok=True)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Failed to create output folder '{output_folder_path}': {e}")
+            return False
+        return True
+
     def select_output_folder_path(self):
         options = QFileDialog.Options()
         folderPath = QFileDialog.getExistingDirectory(self, "Select Output Folder", "", options=options)
@@ -662,46 +821,58 @@ class AssistantConfigDialog(QDialog):
             self.micButton.setIcon(self.mic_off_icon)
             self.speech_input_handler.stop_listening_from_mic()
         else:
+            self.currentHypothesis = ""
+            self._hypothesis_cursor = None
             self.micButton.setIcon(self.mic_on_icon)
             self.speech_input_handler.start_listening_from_mic()
         self.is_mic_on = not self.is_mic_on
 
+    @Slot(str)
     def on_user_input(self, text):
         # Update the instructions editor with the hypothesis result
-        if self.currentHypothesis:
-            # Remove the last hypothesis before adding the new one
-            currentText = self.newInstructionsEdit.toPlainText()
-            updatedText = currentText.rsplit(self.currentHypothesis, 1)[0] + text
-            self.newInstructionsEdit.setPlainText(updatedText)
+        if self._hypothesis_cursor is not None:
+            # Replace the selected span of the last hypothesis with the new one
+            self._hypothesis_cursor.insertText(text)
         else:
-            # If no previous hypothesis, just update the text
+            # If no previous hypothesis, insert the text at the cursor and keep a cursor on the document for it
             self.newInstructionsEdit.insertPlainText(text)
+            self._hypothesis_cursor = self.newInstructionsEdit.textCursor()
+        self._select_hypothesis(text)
         self.currentHypothesis = text
 
+    @Slot(str)
     def on_user_input_complete(self, text):
         # Replace the hypothesis with the complete result
-        if self.currentHypothesis:
-            # Remove the last hypothesis before adding the complete text
-            currentText = self.newInstructionsEdit.toPlainText()
-            updatedText = currentText.rsplit(self.currentHypothesis, 1)[0] + text + "\n"
-            self.newInstructionsEdit.setPlainText(updatedText)
+        if self._hypothesis_cursor is not None:
+            self._hypothesis_cursor.insertText(text + "\n")
         else:
             # If no previous hypothesis, just append the text
             self.newInstructionsEdit.append(text)
         self.currentHypothesis = ""
+        self._hypothesis_cursor = None
         # Move the cursor to the end
         self.newInstructionsEdit.moveCursor(QtGui.QTextCursor.End)
 
+    def _select_hypothesis(self, text):
+        # Select the just inserted hypothesis, Qt keeps the selection in place when text before it is edited
+        cursor = self._hypothesis_cursor
+        end = cursor.position()
+        # Qt positions count UTF-16 code units
+        cursor.setPosition(end - len(text.encode('utf-16-le')) // 2)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+
     def check_instructions(self):
-        threading.Thread(target=self._check_instructions, args=()).start()
+        # Ignore repeated clicks while a review is already running
+        if self._review_busy:
+            return
+        self._review_busy = True
+        QThreadPool.globalInstance().start(InstructionsReviewRunnable(self, self.newInstructionsEdit.toPlainText()))
 
-    def _check_instructions(self):
+    def _check_instructions(self, instructions):
         try:
             if not hasattr(self, 'instructions_reviewer'):
                 raise Exception("Instruction reviewer is not available, check the system assistant settings")
             self.start_processing_signal.start_signal.emit(ActivityStatus.PROCESSING)
-            # Combine instructions and check them
-            instructions = self.newInstructionsEdit.toPlainText()
             self.reviewed_instructions = self.instructions_reviewer.process_messages(user_request=instructions, stream=False)
         except Exception as e:
             self.error_signal.error_signal.emit(str(e))
@@ -713,6 +884,7 @@ class AssistantConfigDialog(QDialog):
 
     def stop_processing(self, status):
         self.status_bar.stop_animation(status)
+        self._review_busy = False
         try:
             # Open new dialog with the checked instructions
             contentDialog = ContentDisplayDialog(self.reviewed_instructions, "AI Reviewed Instructions", self)
@@ -721,7 +893,8 @@ class AssistantConfigDialog(QDialog):
             logger.error(f"Error displaying reviewed instructions: {e}")
 
     def pre_load_assistant_config(self, name):
-        self.assistant_config = AssistantConfigManager.get_instance().get_config(name)
+        self._ensure_tab(1)
+        self.assistant_config = self.assistant_config_manager.get_config(name)
         if self.assistant_config:
             self.nameEdit.setText(self.assistant_config.name)
             self.assistant_id = self.assistant_config.assistant_id
@@ -737,25 +910,18 @@ class AssistantConfigDialog(QDialog):
             self.pre_select_functions()
 
             # Pre-fill reference files
-            for file_path in self.assistant_config.file_references:
-                self.fileReferenceList.addItem(file_path)
+            self.fileReferenceList.addItems(list(self.assistant_config.file_references))
 
             # Accessing code interpreter files from the tool resources
             if self.assistant_config.tool_resources:
                 code_interpreter_files = self.assistant_config.tool_resources.code_interpreter_files
                 if code_interpreter_files:
-                    for file_path, file_id in code_interpreter_files.items():
-                        self.code_interpreter_files[file_path] = file_id
-                        self.codeFileList.addItem(f"{file_path}")
+                    self.code_interpreter_file_model.add_files(code_interpreter_files)
                 self.codeInterpreterCheckBox.setChecked(self.assistant_config.code_interpreter)
 
                 for vector_store in self.assistant_config.tool_resources.file_search_vector_stores:
                     self.vector_store_ids.append(vector_store.id)
-                    for file_path, file_id in vector_store.files.items():
-                        item = QListWidgetItem(file_path)
-                        item.setData(Qt.UserRole, file_id)
-                        self.file_search_files[file_path] = file_id
-                        self.fileSearchList.addItem(item)
+                    self.file_search_file_model.add_files(vector_store.files)
                 self.fileSearchCheckBox.setChecked(bool(self.assistant_config.file_search))
 
             # Load completion settings
@@ -812,51 +978,41 @@ class AssistantConfigDialog(QDialog):
                 self.maxMessagesEdit.setValue(10)
 
     def pre_select_functions(self):
+        # Index function configs and list items by function name once, instead of rescanning per selected function
+        function_configs = self.function_config_manager.get_function_configs()
+        name_to_config = {func_config.name: func_config for funcs in function_configs.values() for func_config in funcs}
+        name_to_item = {}
+        for list_widget in [self.systemFunctionsList, self.userFunctionsList]:
+            for i in range(list_widget.count()):
+                listItem = list_widget.item(i)
+                name_to_item[listItem.text()] = listItem
+
         # Iterate over all selected functions
         for func in self.assistant_config.functions:
             func_name = func['function']['name']
-
-            # Find the category of each function
-            function_configs = self.function_config_manager.get_function_configs()
-            for func_type, funcs in function_configs.items():
-                # Check if the function is in the current category and set the corresponding item as checked
-                for func_config in funcs:
-                    if func_config.name == func_name:
-                        if func_config.get_full_spec() not in self.functions:
-                            self.functions.append(func_config.get_full_spec())
-                        list_widget = self.systemFunctionsList if func_type == 'system' else self.userFunctionsList
-                        for i in range(list_widget.count()):
-                            listItem = list_widget.item(i)
-                            if listItem.text() == func_name:
-                                listItem.setCheckState(Qt.Checked)
-                                break  # Break since we've found and checked the item
+            func_config = name_to_config.get(func_name)
+            if func_config is None:
+                continue
+            self.functions[func_name] = func_config.get_full_spec()
+            listItem = name_to_item.get(func_name)
+            if listItem is not None:
+                listItem.setCheckState(Qt.Checked)
 
     def create_function_section(self, list_widget, function_type, funcs):
         for func_config in funcs:
+            # QListWidgetItem is user checkable by default, setting the check state shows the checkbox
             listItem = QListWidgetItem(func_config.name)
-            listItem.setFlags(listItem.flags() | Qt.ItemIsUserCheckable)  # Allow the item to be checkable
             listItem.setCheckState(Qt.Unchecked)
             listItem.setData(Qt.UserRole, func_config)  # Store the function config object for later retrieval
             list_widget.addItem(listItem)
 
+    @Slot(QListWidgetItem)
     def handle_function_selection(self, item):
-        self.functions = []
-        
-        # Since the method now receives an item, we can check directly if this item is checked
+        functionConfig = item.data(Qt.UserRole)
         if item.checkState() == Qt.Checked:
-            functionConfig = item.data(Qt.UserRole)
-            # if functionConfig is already in the list, don't add it again
-            if functionConfig.get_full_spec() not in self.functions:
-                self.functions.append(functionConfig.get_full_spec())
-
-        # However, to maintain a complete list of checked items, we still need to iterate over all items
-        for listWidget in [self.systemFunctionsList, self.userFunctionsList]:
-            for i in range(listWidget.count()):
-                listItem = listWidget.item(i)
-                if listItem.checkState() == Qt.Checked:
-                    functionConfig = listItem.data(Qt.UserRole)
-                    if functionConfig.get_full_spec() not in self.functions:
-                        self.functions.append(functionConfig.get_full_spec())
+            self.functions[functionConfig.name] = functionConfig.get_full_spec()
+        else:
+            self.functions.pop(functionConfig.name, None)
 
     def add_reference_file(self):
         self.fileReferenceList.addItem(QFileDialog.getOpenFileName(None, "Select File", "", "All Files (*)")[0])
@@ -866,29 +1022,35 @@ class AssistantConfigDialog(QDialog):
         for item in selected_items:
             self.fileReferenceList.takeItem(self.fileReferenceList.row(item))
 
-    def add_file(self, file_dict, list_widget):
+    def add_file(self, file_model):
         options = QFileDialog.Options()
         filePath, _ = QFileDialog.getOpenFileName(None, "Select File", "", "All Files (*)", options=options)
         if filePath:
-            if filePath in file_dict:
+            if filePath in file_model:
                 QMessageBox.warning(None, "File Already Added", f"The file '{filePath}' is already in the list.")
             else:
-                file_dict[filePath] = None  # Initialize the file ID as None or any default value you wish
-                list_widget.addItem(filePath)
+                file_model.add_file(filePath)  # The file ID is set once the file is uploaded
 
-    def remove_file(self, file_dict, list_widget):
-        selected_items = list_widget.selectedItems()
-        if not selected_items:
+    def remove_file(self, file_model, list_view):
+        selected_rows = [index.row() for index in list_view.selectionModel().selectedIndexes()]
+        if not selected_rows:
             return
-        for item in selected_items:
-            del file_dict[item.text()]
-            list_widget.takeItem(list_widget.row(item))
+        file_model.remove_rows(selected_rows)
 
     def save_configuration(self):
+        # Read each required field once and validate before building the configuration
         if self.tabWidget.currentIndex() == 3:
-            self.instructionsEdit.setPlainText(self.newInstructionsEdit.toPlainText())
-
+            instructions = self.newInstructionsEdit.toPlainText()
+            self.instructionsEdit.setPlainText(instructions)
+        else:
+            instructions = self.instructionsEdit.toPlainText()
         self.assistant_name = self.get_name()
+        model = self.modelComboBox.currentText()
+        if not self.assistant_name or not instructions or not model:
+            QMessageBox.information(self, "Missing Fields", "Name, Instructions, and Model are required fields.")
+            return
+
+        self._ensure_tab(1)
 
         # Conditional setup for completion settings based on assistant_type
         completion_settings = None
@@ -918,20 +1080,10 @@ class AssistantConfigDialog(QDialog):
                     'truncation_strategy': truncation_strategy
                 }
         
-            code_interpreter_files = {}
-            for i in range(self.codeFileList.count()):
-                item = self.codeFileList.item(i)  # Get the QListWidgetItem at index i
-                file_path = item.text()  # Assuming the file path is the item text
-                file_id = self.code_interpreter_files.get(file_path)
-                code_interpreter_files[file_path] = file_id
+            code_interpreter_files = self.code_interpreter_file_model.files()
 
             vector_stores = []
-            vector_store_files = {}
-            for i in range(self.fileSearchList.count()):
-                item = self.fileSearchList.item(i)
-                file_path = item.text()
-                file_id = item.data(Qt.UserRole)  # Assuming file ID is stored as UserRole data
-                vector_store_files[file_path] = file_id
+            vector_store_files = self.file_search_file_model.files()
 
             id = self.vector_store_ids[0] if self.vector_store_ids else None
             if id or vector_store_files:
@@ -947,12 +1099,12 @@ class AssistantConfigDialog(QDialog):
 
         config = {
             'name': self.assistant_name,
-            'instructions': self.instructionsEdit.toPlainText(),
-            'model': self.modelComboBox.currentText(),
+            'instructions': instructions,
+            'model': model,
             'assistant_id': self.assistant_id if not self.is_create else '',
             'file_references': [self.fileReferenceList.item(i).text() for i in range(self.fileReferenceList.count())],
             'tool_resources': tool_resources.to_dict() if self.assistant_type == "assistant" else None,
-            'functions': self.functions,
+            'functions': list(self.functions.values()),
             'file_search': self.fileSearchCheckBox.isChecked() if self.assistant_type == "assistant" else False,
             'code_interpreter': self.codeInterpreterCheckBox.isChecked() if self.assistant_type == "assistant" else False,
             'output_folder_path': self.outputFolderPathEdit.text(),
@@ -961,12 +1113,11 @@ class AssistantConfigDialog(QDialog):
             'completion_settings': completion_settings
         }
 
-        # Validation and emission of the configuration
-        if not config['name'] or not config['instructions'] or not config['model']:
-            QMessageBox.information(self, "Missing Fields", "Name, Instructions, and Model are required fields.")
+        if not self._ensure_output_folder():
             return
 
-        assistant_config_json = json.dumps(config, indent=4)
+        # The JSON is only parsed by the assistant client's from_json, so skip pretty-printing
+        assistant_config_json = json.dumps(config)
         self.assistantConfigSubmitted.emit(assistant_config_json, self.aiClientComboBox.currentText(), self.assistant_type)
 
 
@@ -1005,24 +1156,27 @@ class ExportAssistantDialog(QDialog):
         os.makedirs(config_path, exist_ok=True)
         os.makedirs(functions_path, exist_ok=True)
 
-        # Copy the required JSON files
-        try:
-            shutil.copyfile(f"config/{assistant_name}_assistant_config.yaml", os.path.join(config_path, f"{assistant_name}_assistant_config.yaml"))
-            shutil.copyfile("config/function_error_specs.json", os.path.join(config_path, "function_error_specs.json"))
-        except FileNotFoundError as e:
-            QMessageBox.critical(self, "Export Failed", f"Failed to copy configuration files: {e}")
-            return
-
-        # Check and copy user_functions.py if exists
+        # Copy the required files concurrently
+        copies = [
+            (f"config/{assistant_name}_assistant_config.yaml", os.path.join(config_path, f"{assistant_name}_assistant_config.yaml")),
+            ("config/function_error_specs.json", os.path.join(config_path, "function_error_specs.json"))
+        ]
+        # Copy user_functions.py if exists
         user_functions_src = os.path.join("functions", "user_functions.py")
         if os.path.exists(user_functions_src):
-            shutil.copyfile(user_functions_src, os.path.join(functions_path, "user_functions.py"))
+            copies.append((user_functions_src, os.path.join(functions_path, "user_functions.py")))
+
+        with ThreadPoolExecutor(max_workers=len(copies)) as executor:
+            futures = [executor.submit(shutil.copyfile, src, dst) for src, dst in copies]
+        errors = [str(future.exception()) for future in futures if future.exception()]
+        if errors:
+            QMessageBox.critical(self, "Export Failed", "Failed to copy files:\n" + "\n".join(errors))
+            return
 
         # Read template, replace placeholder, and create main.py
         template_path = os.path.join("templates", "async_stream_template.py")
         try:
-            with open(template_path, "r") as template_file:
-                template_content = template_file.read()
+            template_content = _read_template(template_path)
 
             main_content = template_content.replace("ASSISTANT_NAME", assistant_name)
             if assistant_config.assistant_type == "chat_assistant":
@@ -59,3 +59,7 @@ class DiagnosticEndRunSignal(QObject):
 class ErrorSignal(QObject):
     # Define a signal that carries error message
     error_signal = Signal(str)
+
+class ModelsLoadedSignal(QObject):
+    # Define a signal that carries AI client type name and list of model ids
+    loaded_signal = Signal(str, list)
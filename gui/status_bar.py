@@ -18,6 +18,7 @@ class ActivityStatus(Enum):
     PROCESSING_USER_INPUT = "UserInput"
     PROCESSING_SCHEDULED_TASK = "ScheduledTask"
     LISTENING = "Listening"
+    LOADING_MODELS = "LoadingModels"
 
 
 class StatusBar:
@@ -46,7 +47,8 @@ class StatusBar:
         elif self.active_statuses:
             status_labels = {
                 ActivityStatus.PROCESSING_USER_INPUT: "User Input",
-                ActivityStatus.PROCESSING_SCHEDULED_TASK: "Scheduled Task"
+                ActivityStatus.PROCESSING_SCHEDULED_TASK: "Scheduled Task",
+                ActivityStatus.LOADING_MODELS: "Loading Models"
             }
             active_labels = [status_labels.get(status, "") for status in self.active_statuses.keys()]
             status_message = " | ".join(filter(None, active_labels))
@@ -7,6 +7,7 @@
 from PySide6.QtWidgets import QMessageBox
 
 import sys, os, re
+from functools import lru_cache
 
 from azure.ai.assistant.management.logger_module import logger
 from azure.ai.assistant.management.assistant_config import AssistantConfig
@@ -14,6 +15,7 @@ from azure.ai.assistant.management.ai_client_factory import AIClientType
 from azure.ai.assistant.management.chat_assistant_client import ChatAssistantClient
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """ 
     Get absolute path to resource, works for development and for PyInstaller 
@@ -272,6 +272,32 @@ class AssistantConfigManager:
         else:
             return [assistant_name for assistant_name, assistant_config in self._configs.items() if (assistant_config.ai_client_type == ai_client_type and assistant_config.assistant_role != "system")]
 
+    def get_assistant_names_by_client_and_type(
+            self,
+            ai_client_type : str,
+            assistant_type : str,
+            include_system_assistants : bool = False
+    ) -> list:
+        """
+        Gets the names of all assistants based on the AI client type and assistant type.
+
+        :param ai_client_type: The AI client type to filter the assistant names.
+        :type ai_client_type: str
+        :param assistant_type: The assistant type to filter the assistant names, e.g. "assistant" or "chat_assistant".
+        :type assistant_type: str
+        :param include_system_assistants: Whether to include assistants with the "system" role.
+        :type include_system_assistants: bool
+
+        :return: A list of assistant names based on the AI client type and assistant type.
+        :rtype: list
+        """
+        return [
+            assistant_name for assistant_name, assistant_config in self._configs.items()
+            if assistant_config.ai_client_type == ai_client_type
+            and assistant_config.assistant_type == assistant_type
+            and (include_system_assistants or assistant_config.assistant_role != "system")
+        ]
+
     def get_assistant_name_by_assistant_id(
             self,
             assistant_id : str
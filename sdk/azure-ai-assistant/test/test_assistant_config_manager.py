@@ -0,0 +1,33 @@
+# Copyright (c) Microsoft. All rights reserved.
+# Licensed under the MIT license. See LICENSE.md file in the project root for full license information.
+
+import json
+
+from azure.ai.assistant.management.assistant_config_manager import AssistantConfigManager
+
+
+def add_test_config(manager, name, ai_client_type, assistant_type, assistant_role="user"):
+    config = {
+        "name": name,
+        "instructions": "You are test assistant",
+        "model": "gpt-4o",
+        "assistant_id": "",
+        "ai_client_type": ai_client_type,
+        "assistant_type": assistant_type,
+        "assistant_role": assistant_role
+    }
+    manager.update_config(name, json.dumps(config))
+
+
+def test_get_assistant_names_by_client_and_type(tmp_path):
+    manager = AssistantConfigManager(config_folder=str(tmp_path))
+    add_test_config(manager, "openai_assistant", "OPEN_AI", "assistant")
+    add_test_config(manager, "openai_chat_assistant", "OPEN_AI", "chat_assistant")
+    add_test_config(manager, "azure_assistant", "AZURE_OPEN_AI", "assistant")
+    add_test_config(manager, "openai_system_assistant", "OPEN_AI", "assistant", assistant_role="system")
+
+    assert manager.get_assistant_names_by_client_and_type("OPEN_AI", "assistant") == ["openai_assistant"]
+    assert manager.get_assistant_names_by_client_and_type("OPEN_AI", "chat_assistant") == ["openai_chat_assistant"]
+    assert manager.get_assistant_names_by_client_and_type("AZURE_OPEN_AI", "assistant") == ["azure_assistant"]
+    assert manager.get_assistant_names_by_client_and_type("AZURE_OPEN_AI", "chat_assistant") == []
+    assert manager.get_assistant_names_by_client_and_type("OPEN_AI", "assistant", include_system_assistants=True) == ["openai_assistant", "openai_system_assistant"]